@@ -3,16 +3,27 @@ Core extraction logic for incident timeline analysis.
 Uses patterns from patterns.py to extract structured information.
 """
 
+import datetime
 import re
-from typing import List, Dict, Optional
+import sys
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
 from patterns import (
-    TIMESTAMP_PATTERNS,
-    ACTOR_PATTERNS,
-    ACTION_KEYWORDS,
+    TIMESTAMP_RE,
+    ACTOR_RE,
+    ACTION_RE,
     SEVERITY_KEYWORDS,
+    SEVERITY_RE,
     ENTITY_PATTERNS,
 )
 
+# Words just before a time-like match that mean it isn't a timestamp
+# ("error ratio of 3:45", "running version 1:45"). Plain substring match.
+_TIMESTAMP_FALSE_POSITIVE_RE = re.compile(r'ratio|version|scaled')
+
+# Placeholder domains that show up in examples and docs, not incidents
+_PLACEHOLDER_DOMAINS = frozenset({'example.com', 'test.com', 'localhost.local'})
+
 
 def extract_timeline(text: str) -> List[Dict[str, str]]:
     """
@@ -33,120 +44,184 @@ def extract_timeline(text: str) -> List[Dict[str, str]]:
         [{'time': '14:23', 'text': '@sarah 14:23: Seeing elevated errors', 'actor': 'sarah'}]
     """
     events = []
-    
-    # Split text into lines for processing
-    lines = text.strip().split('\n')
-    
-    for line in lines:
-        # Strip whitespace from each line
-        line = line.strip()
+    actors = {}
+    pos = 0
+    
+    # Scan the whole text once instead of line by line; most chat lines
+    # have no timestamp, and TIMESTAMP_RE skips them without a per-line
+    # Python round trip
+    while True:
+        match = _search_timestamp(text, pos)
+        if match is None:
+            break
         
-        # Skip empty lines
-        if not line:
-            continue
-
-        # Try to find a timestamp in this line
-        timestamp = _find_timestamp(line)
-        if not timestamp:
-            continue
+        line_start = text.rfind('\n', 0, match.start()) + 1
+        line_end = text.find('\n', match.end())
+        if line_end == -1:
+            line_end = len(text)
+        line = text[line_start:line_end].strip()
         
         # Extract actor if present
         actor = _find_actor(line)
         
         # Create event entry
         event = {
-            'time': timestamp,
-            'text': line.strip(),
+            'time': match.group(),
+            'text': line,
         }
         if actor:
-            event['actor'] = actor
+            # The same few people post most lines; share one string per
+            # actor within this call. Not sys.intern: actors are untrusted
+            # text, and CPython 3.12 never frees interned strings
+            event['actor'] = actors.setdefault(actor, actor)
         
         events.append(event)
+        
+        # One event per line: continue from the next line
+        pos = line_end + 1
     
-    # Sort by time (if possible)
-    # For now, keep original order - we can add sorting later
+    # Sort by time. Chat logs are almost always already in order, which
+    # timsort handles in a single linear pass; ties keep original order
+    keys = _timeline_sort_keys(events)
+    return [events[i] for i in sorted(range(len(events)), key=keys.__getitem__)]
+
+
+def _split_lines(text: str) -> List[str]:
+    """
+    Split text into stripped, non-empty lines.
     
-    return events
+    Used by the line-by-line fallback in _actions_from_lower.
+    """
+    return [line for line in (raw.strip() for raw in text.split('\n')) if line]
+
+
+def _parse_timestamp(timestamp: str) -> Tuple[Optional[str], int]:
+    """
+    Split a matched timestamp into (date, seconds since midnight).
+    
+    Date is 'YYYY-MM-DD' for the iso8601/full_datetime formats and None
+    for time-only formats.
+    
+    Example:
+        >>> _parse_timestamp('2024-10-15T14:23:15Z')
+        ('2024-10-15', 51795)
+        >>> _parse_timestamp('9:05')
+        (None, 32700)
+    """
+    date = None
+    clock = timestamp
+    if timestamp[4:5] == '-':
+        date = timestamp[:10]
+        clock = timestamp[10:].strip().strip('TZ')
+    
+    parts = clock.split(':')
+    seconds = int(parts[0]) * 3600 + int(parts[1]) * 60
+    if len(parts) > 2:
+        seconds += int(parts[2])
+    return date, seconds
+
+
+def _timeline_sort_keys(events: List[Dict[str, str]]) -> List[Tuple[int, int]]:
+    """
+    Build a (day number, seconds) sort key for each event, in input order.
+    
+    Dated events use their calendar date's ordinal. Time-only events inherit
+    the day of the event above them; when one is more than 12 hours earlier
+    than the event before it, the log is assumed to have crossed midnight
+    (23:55 -> 00:05), so it moves to the next day rather than sorting to
+    the top. The rollover is added to the day number itself, so a later
+    dated event ('2024-01-16 00:05') still sorts against it correctly.
+    Dates the pattern accepts but the calendar doesn't ('2024-13-45') are
+    treated as time-only.
+    """
+    keys = []
+    day, previous = 0, None
+    
+    for event in events:
+        event_date, seconds = _parse_timestamp(event['time'])
+        ordinal = None
+        if event_date is not None:
+            try:
+                ordinal = datetime.date.fromisoformat(event_date).toordinal()
+            except ValueError:
+                pass
+        if ordinal is not None:
+            day = ordinal
+        elif previous is not None and seconds < previous - 12 * 3600:
+            day += 1
+        previous = seconds
+        keys.append((day, seconds))
+    
+    return keys
 
 
 def _find_timestamp(text: str) -> Optional[str]:
     """
-    Find first timestamp in text using TIMESTAMP_PATTERNS.
+    Find first timestamp in text using the fused TIMESTAMP_RE.
     Returns the timestamp string or None.
     """
-    for pattern in TIMESTAMP_PATTERNS.values():
-        match = re.search(pattern, text)
-        if match:
-            # Filter out false positives (context-based filtering)
-            timestamp = match.group()
-            if _is_likely_timestamp(text, timestamp):
-                return timestamp
-    return None
+    match = _search_timestamp(text)
+    return match.group() if match else None
 
 
-def _is_likely_timestamp(text: str, timestamp: str) -> bool:
+def _search_timestamp(text: str, pos: int = 0) -> Optional[re.Match]:
+    """
+    Find the first likely timestamp in text at or after pos.
+    
+    Candidates whose own line marks them as false positives ("ratio of
+    3:45") are skipped. extract_timeline calls this with pos at the start
+    of each line still to be scanned.
+    """
+    search = TIMESTAMP_RE.search
+    while True:
+        match = search(text, pos)
+        if match is None:
+            return None
+        
+        start = match.start()
+        line_start = text.rfind('\n', 0, start) + 1
+        
+        # Filter out false positives (context-based filtering)
+        if _is_likely_timestamp(text, start, line_start):
+            return match
+        pos = match.end()
+
+
+def _is_likely_timestamp(text: str, start: int, line_start: int) -> bool:
     """
     Context-based filtering to reduce false positives.
     
     Filters out patterns like:
     - "error ratio of 3:45" (ratio, not time)
     - "running version 1:45" (version, not time)
-    """
-    text_lower = text.lower()
-    
-    # Check for false positive indicators
-    false_positive_words = ['ratio', 'version', 'scaled']
     
-    # Get text around the timestamp
-    timestamp_index = text.find(timestamp)
-    if timestamp_index > 0:
-        # Look at ~20 chars before timestamp
-        context_before = text_lower[max(0, timestamp_index-20):timestamp_index]
-        
-        for word in false_positive_words:
-            if word in context_before:
-                return False
+    Args:
+        text: The text containing the candidate timestamp
+        start: Index where the candidate starts (match.start())
+        line_start: Index where the candidate's line starts, so the
+            context window never reaches into the previous line
+    """
+    # Look at ~20 chars before timestamp (only that window is lowercased)
+    context_before = text[max(line_start, start-20):start].lower()
     
-    return True
+    # Check for false positive indicators in one scan
+    return _TIMESTAMP_FALSE_POSITIVE_RE.search(context_before) is None
 
 
 def _find_actor(text: str) -> Optional[str]:
     """
-    Find actor (person) in text using ACTOR_PATTERNS.
+    Find first actor (person) in text using the fused ACTOR_RE.
     Returns actor name/username or None.
-    """
-    for pattern in ACTOR_PATTERNS.values():
-        match = re.search(pattern, text)
-        if match:
-            actor = match.group(1)
-            # Filter out common false positives (labels)
-            if _is_likely_actor(actor):
-                return actor
-    return None
-
-
-def _is_likely_actor(actor: str) -> bool:
-    """
-    Context-based filtering for actor names.
     
-    Filters out common labels like:
-    - Time, Error, Status, Note
-    - Domain names (ending in .com, .org, etc.)
+    The leftmost match wins, so a speaker prefix like "sarah.chen:" takes
+    precedence over @mentions later in the same line. Common labels
+    (Error:, Status:) and domain names are rejected by ACTOR_PATTERNS
+    itself, so the first match is always the actor.
     """
-    common_labels = ['time', 'error', 'status', 'note', 'warning', 
-                     'info', 'debug', 'system']
-    
-    # Filter common labels
-    if actor.lower() in common_labels:
-        return False
-    
-    # Filter domain names - check if it ends with common TLD
-    common_tlds = ['.com', '.org', '.net', '.io', '.co', '.edu', '.gov']
-    actor_lower = actor.lower()
-    if any(actor_lower.endswith(tld) for tld in common_tlds):
-        return False
-    
-    return True
+    match = ACTOR_RE.search(text)
+    if match is None:
+        return None
+    return match.group(match.lastindex)
 
 def identify_actions(text: str) -> List[Dict[str, str]]:
     """
@@ -167,30 +242,69 @@ def identify_actions(text: str) -> List[Dict[str, str]]:
         [{'action': 'deployed', 'category': 'remediation', 
           'context': '@sarah deployed fix to production'}]
     """
+    return _actions_from_lower(text, text.lower())
+
+
+def _actions_from_lower(text: str, text_lower: str) -> List[Dict[str, str]]:
+    """
+    Identify actions given text and text_lower = text.lower().
+    
+    Scans the whole lowercased text once instead of line by line,
+    jumping to the next line after each hit (only the first action per
+    line is recorded). Context is cut from the original text, which only
+    works while both strings have the same length; a few characters
+    lowercase to two ('İ'), in which case we match line by line instead.
+    """
+    if len(text_lower) != len(text):
+        return _actions_from_lines(_split_lines(text), _split_lines(text_lower))
+    
     actions = []
-    lines = text.strip().split('\n')
+    search = ACTION_RE.search
+    pos = 0
     
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
+    while True:
+        match = search(text_lower, pos)
+        if match is None:
+            break
+        
+        line_start = text.rfind('\n', 0, match.start()) + 1
+        line_end = text.find('\n', match.end())
+        if line_end == -1:
+            line_end = len(text)
         
-        line_lower = line.lower()
+        # Category (the group name) is already one shared string;
+        # intern the keyword too, as it repeats across many lines
+        actions.append({
+            'action': sys.intern(match.group()),
+            'category': match.lastgroup,
+            'context': text[line_start:line_end].strip(),
+        })
         
-        # Check each category of actions
-        for category, keywords in ACTION_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in line_lower:
-                    actions.append({
-                        'action': keyword,
-                        'category': category,
-                        'context': line,
-                    })
-                    # Only record first action found per line
-                    break
-            if actions and actions[-1]['context'] == line:
-                # Already found an action in this line
-                break
+        pos = line_end + 1
+    
+    return actions
+
+
+def _actions_from_lines(lines: List[str], lines_lower: List[str]) -> List[Dict[str, str]]:
+    """
+    Identify actions from pre-split lines (see _split_lines).
+    
+    lines_lower must be _split_lines(text.lower()) for the same text.
+    Lowercasing never adds or removes whitespace, so it lines up 1:1
+    with lines.
+    """
+    actions = []
+    
+    for line, line_lower in zip(lines, lines_lower):
+        # One scan finds the first action mentioned in the line
+        # (only the first action per line is recorded)
+        match = ACTION_RE.search(line_lower)
+        if match:
+            actions.append({
+                'action': sys.intern(match.group()),
+                'category': match.lastgroup,
+                'context': line,
+            })
     
     return actions
 
@@ -213,48 +327,44 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
         {'services': ['payment-service'], 'ips': ['10.0.0.1'], 
          'domains': ['api.example.com']}
     """
-    entities = {
-        'services': [],
-        'ips': [],
-        'domains': [],
-    }
-    
-    text_lower = text.lower()
+    # dict.fromkeys dedups in O(1) per match while keeping first-seen order;
+    # validators then run once per unique candidate instead of per match
     
-    # Extract services
-    service_pattern = ENTITY_PATTERNS['service']
-    for match in re.finditer(service_pattern, text_lower):
-        service = match.group(1)
-        if service not in entities['services']:
-            entities['services'].append(service)
+    # Extract services (pattern is case-insensitive, normalize to lowercase)
+    services = dict.fromkeys(
+        match.group(1).lower()
+        for match in ENTITY_PATTERNS['service'].finditer(text)
+    )
     
-    # Extract IPs
-    ip_pattern = ENTITY_PATTERNS['ip']
-    for match in re.finditer(ip_pattern, text):
-        ip = match.group(1)
-        if _is_valid_ip(ip) and ip not in entities['ips']:
-            entities['ips'].append(ip)
+    # Extract IPs (octet range 0-255 is enforced by the pattern itself)
+    ips = dict.fromkeys(
+        match.group(1)
+        for match in ENTITY_PATTERNS['ip'].finditer(text)
+    )
     
     # Extract domains
-    domain_pattern = ENTITY_PATTERNS['domain']
-    for match in re.finditer(domain_pattern, text_lower):
-        domain = match.group(1)
-        if _is_likely_domain(domain) and domain not in entities['domains']:
-            entities['domains'].append(domain)
+    domains = dict.fromkeys(
+        match.group(1).lower()
+        for match in ENTITY_PATTERNS['domain'].finditer(text)
+    )
     
-    return entities
+    return {
+        'services': list(services),
+        'ips': list(ips),
+        'domains': [domain for domain in domains if _is_likely_domain(domain)],
+    }
 
 
 def _is_valid_ip(ip: str) -> bool:
     """
     Validate that IP address has valid octets (0-255).
     Filters out invalid IPs like 999.999.999.999.
+    
+    ENTITY_PATTERNS['ip'] already enforces the octet range, so
+    extract_entities doesn't need to call this; it's kept for validating
+    standalone strings.
     """
-    octets = ip.split('.')
-    try:
-        return all(0 <= int(octet) <= 255 for octet in octets)
-    except ValueError:
-        return False
+    return ENTITY_PATTERNS['ip'].fullmatch(ip) is not None
 
 
 def _is_likely_domain(domain: str) -> bool:
@@ -270,8 +380,7 @@ def _is_likely_domain(domain: str) -> bool:
         return False
     
     # Filter common false positives
-    false_positives = ['example.com', 'test.com', 'localhost.local']
-    if domain in false_positives:
+    if domain in _PLACEHOLDER_DOMAINS:
         return False
     
     return True
@@ -295,21 +404,38 @@ def detect_severity(text: str) -> Dict[str, any]:
         {'level': 'critical', 'confidence': 'high', 
          'indicators': ['down', 'outage']}
     """
-    text_lower = text.lower()
+    return _severity_from_lower(text.lower())
+
+
+def _has_keyword(text_lower: str, keyword: str) -> bool:
+    """
+    Check whether a severity keyword starts a word somewhere in text_lower.
     
-    # Count indicators for each severity level
+    str.find jumps straight to each literal occurrence (C substring
+    search, much faster than a regex scan for a fixed string);
+    SEVERITY_RE then confirms it is a keyword match there: at a word
+    start ("this downstream" doesn't count as 'is down') and not part of a
+    longer keyword that SEVERITY_RE would prefer at that position.
+    """
+    pos = text_lower.find(keyword)
+    while pos != -1:
+        match = SEVERITY_RE.match(text_lower, pos)
+        if match and match.group(match.lastgroup) == keyword:
+            return True
+        pos = text_lower.find(keyword, pos + 1)
+    return False
+
+
+def _severity_from_lower(text_lower: str) -> Dict[str, any]:
+    """
+    Detect severity from already-lowercased text (see detect_severity).
+    """
+    # Count indicators for each severity level (in keyword-list order)
     severity_scores = {
-        'critical': [],
-        'high': [],
-        'medium': [],
-        'low': [],
+        level: [keyword for keyword in keywords if _has_keyword(text_lower, keyword)]
+        for level, keywords in SEVERITY_KEYWORDS.items()
     }
     
-    for level, keywords in SEVERITY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                severity_scores[level].append(keyword)
-    
     # Determine overall severity (highest level with indicators)
     if severity_scores['critical']:
         level = 'critical'
@@ -367,36 +493,38 @@ def generate_summary(text: str) -> Dict[str, any]:
         {'timeline': [...], 'actions': [...], 'entities': {...}, 
          'severity': {...}, 'summary_text': '...'}
     """
-    # Run all extractors
+    # Run all extractors, sharing one lowercased copy
+    text_lower = text.lower()
     timeline = extract_timeline(text)
-    actions = identify_actions(text)
+    actions = _actions_from_lower(text, text_lower)
     entities = extract_entities(text)
-    severity = detect_severity(text)
+    severity = _severity_from_lower(text_lower)
     
     # Generate human-readable summary text
     summary_parts = []
     
     # Severity
-    if severity['level'] != 'unknown':
+    level = severity['level']
+    if level != 'unknown':
         summary_parts.append(
-            f"Severity: {severity['level'].upper()} "
+            f"Severity: {level.upper()} "
             f"(confidence: {severity['confidence']})"
         )
     
     # Timeline summary
     if timeline:
         summary_parts.append(f"Timeline: {len(timeline)} events recorded")
-        if timeline[0].get('time'):
-            summary_parts.append(f"  First event: {timeline[0]['time']}")
-        if timeline[-1].get('time'):
-            summary_parts.append(f"  Last event: {timeline[-1]['time']}")
+        first_time = timeline[0].get('time')
+        last_time = timeline[-1].get('time')
+        if first_time:
+            summary_parts.append(f"  First event: {first_time}")
+        if last_time:
+            summary_parts.append(f"  Last event: {last_time}")
     
     # Actions summary
     if actions:
-        action_categories = {}
-        for action in actions:
-            category = action['category']
-            action_categories[category] = action_categories.get(category, 0) + 1
+        # Counter keeps first-seen order, like the dict it replaces
+        action_categories = Counter(action['category'] for action in actions)
         
         summary_parts.append(f"Actions: {len(actions)} total")
         for category, count in action_categories.items():
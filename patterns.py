@@ -5,25 +5,66 @@ Contains regex patterns and keyword lists for extracting structured data.
 
 import re
 
+__all__ = [
+    'TIMESTAMP_PATTERNS',
+    'TIMESTAMP_RE',
+    'ACTOR_PATTERNS',
+    'ACTOR_RE',
+    'ACTION_KEYWORDS',
+    'ACTION_RE',
+    'SEVERITY_KEYWORDS',
+    'SEVERITY_RE',
+    'ENTITY_PATTERNS',
+]
+
 # Timestamp patterns - matches common time formats in incident logs
 # Note: Some ambiguous patterns (like "ratio of 3:45") will match and are
 # filtered by context analysis in extractors.py
 # Ordered from most specific to least specific (dict maintains insertion order in Python 3.7+)
+# All patterns are compiled once at import so extractors can call
+# pattern.search() directly instead of going through re's internal cache
+# Patterns never match across a newline (full_datetime's separator is any
+# whitespace but '\n'), since extractors scan the whole text at once
 TIMESTAMP_PATTERNS = {
-    'iso8601': r'\b(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)\b',
-    'full_datetime': r'\b(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}(?::\d{2})?)\b',
-    'time_with_seconds': r'(?<![:\w])([0-2]?\d):([0-5]\d):([0-5]\d)(?!:\d)\b',
-    'simple_time': r'(?<![:\w])([0-2]?\d):([0-5]\d)(?!:\d)\b',
+    'iso8601': re.compile(r'\b(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)\b'),
+    'full_datetime': re.compile(r'\b(\d{4}-\d{2}-\d{2})[^\S\n]+(\d{2}:\d{2}(?::\d{2})?)\b'),
+    'time_with_seconds': re.compile(r'(?<![:\w])([0-2]?\d):([0-5]\d):([0-5]\d)(?!:\d)\b'),
+    'simple_time': re.compile(r'(?<![:\w])([0-2]?\d):([0-5]\d)(?!:\d)\b'),
 }
 
+# All timestamp formats fused into one alternation so a line is scanned once.
+# Each format is wrapped in a named group (match.lastgroup tells which fired);
+# at the same position the alternatives are tried in TIMESTAMP_PATTERNS order.
+# Every format starts with a digit, so the leading (?=\d) skips all other
+# positions before any alternative (or its lookbehind) is attempted
+TIMESTAMP_RE = re.compile(r'(?=\d)(?:' + '|'.join(
+    f'(?P<{name}>{pattern.pattern})'
+    for name, pattern in TIMESTAMP_PATTERNS.items()
+) + ')')
+
 # Actor/person patterns - identifies who is taking action
 # Note: Names with lowercase particles (de, von, van) are not captured
+# Candidates ending in a common TLD are domain names, not people; the
+# negative lookaheads reject them inside the regex ("@status.io",
+# "google.com:"). Common log labels that look like names ("Error:",
+# "Status:", "@info") are rejected the same way
+_ACTOR_TLDS = r'(?i:com|org|net|io|co|edu|gov)'
+_ACTOR_LABELS = r'(?i:time|error|status|note|warning|info|debug|system)'
 ACTOR_PATTERNS = {
-    'mention': r'@([\w.-]+)',  # Slack-style @mentions: @sarah, @mike.jones
-    'name_with_dot': r'\b([a-z]+\.[a-z]+):',  # firstname.lastname: format (lowercase)
-    'name_colon': r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?):',  # "Sarah:", "Mike Jones:"
+    'mention': re.compile(rf'@(?![\w.-]*\.{_ACTOR_TLDS}(?![\w.-]))(?!{_ACTOR_LABELS}(?![\w.-]))([\w.-]+)'),  # Slack-style @mentions: @sarah, @mike.jones
+    'name_with_dot': re.compile(rf'\b(?![a-z]+\.{_ACTOR_TLDS}:)([a-z]+\.[a-z]+):'),  # firstname.lastname: format (lowercase)
+    'name_colon': re.compile(rf'\b(?=[A-Z])(?!{_ACTOR_LABELS}:)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?):'),  # "Sarah:", "Mike Jones:"
 }
 
+# All actor formats fused into one alternation. Each pattern has exactly one
+# capturing group, so match.group(match.lastindex) is the actor name
+# whichever alternative fired. Every format starts with '@' or a letter;
+# the leading (?=[@a-zA-Z]) skips other positions before any alternative
+# (or its lookaheads) is attempted
+ACTOR_RE = re.compile(r'(?=[@a-zA-Z])(?:' + '|'.join(
+    f'(?:{pattern.pattern})' for pattern in ACTOR_PATTERNS.values()
+) + ')')
+
 # Action verb patterns - common incident response actions
 # Note: Includes common present participle (-ing) and past tense forms
 # Some less common verb forms may not be caught
@@ -70,6 +111,68 @@ ACTION_KEYWORDS = {
     ],
 }
 
+
+def _build_trie_regex(words):
+    """
+    Build a regex alternation from a list of literal words, merging common
+    prefixes into a trie so the engine never re-tests a shared prefix.
+
+    Example:
+        >>> _build_trie_regex(['checking', 'checked'])
+        'check(?:ed|ing)'
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # End-of-word marker
+
+    def render(node):
+        is_word_end = '' in node
+        branches = [
+            re.escape(char) + render(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not is_word_end:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        # Greedy '?' prefers the longer word when one is a prefix of another
+        return group + '?' if is_word_end else group
+
+    return render(trie)
+
+
+def _first_char_class(words):
+    """
+    Build a character class matching the first character of any word.
+    
+    Used as a leading lookahead on the keyword regexes: positions that
+    can't start a keyword are rejected with one cheap class test instead
+    of trying every alternative there.
+    
+    Example:
+        >>> _first_char_class(['slow', 'spike', 'rare'])
+        '[rs]'
+    """
+    return '[' + ''.join(sorted({re.escape(word[0]) for word in words})) + ']'
+
+
+# All action keywords in one regex, one named group per category, so a single
+# scan of a line yields both the keyword (match.group()) and its category
+# (match.lastgroup). Keywords match whole words only ('deployed' but not
+# 'redeployed', 'resolved' but not 'unresolved'). Matches against lowercased
+# text. The leading first-character lookahead skips positions where no
+# keyword can start before any alternative is tried.
+_ACTION_WORDS = [keyword for keywords in ACTION_KEYWORDS.values() for keyword in keywords]
+ACTION_RE = re.compile(f'(?={_first_char_class(_ACTION_WORDS)})' + r'\b(?:' + '|'.join(
+    f'(?P<{category}>{_build_trie_regex(keywords)})'
+    for category, keywords in ACTION_KEYWORDS.items()
+) + r')\b')
+
 # Severity indicator keywords
 SEVERITY_KEYWORDS = {
     'critical': ['critical', 'is down', 'went down', 'outage', 'offline', 'unavailable', 
@@ -82,9 +185,64 @@ SEVERITY_KEYWORDS = {
     'low': ['minor', 'cosmetic', 'edge case', 'rare'],
 }
 
+# All severity keywords in one regex, one named group per level. Read the
+# keyword with match.group(match.lastgroup). extractors._has_keyword finds
+# each literal occurrence with str.find and calls SEVERITY_RE.match at that
+# single position. The body is wrapped in a lookahead so that check is
+# zero-width and consumes nothing (which also lets finditer report
+# overlapping indicators, e.g. 'high error' and 'error rate' in
+# "high error rate").
+# Keywords must start at a word boundary ('is down' must not fire inside
+# "this downstream") but may carry a suffix ('timeouts', 'rarely').
+# _has_keyword relies on no keyword being a prefix of another keyword,
+# in particular one in another level: at a shared position the other
+# alternative would win and the shorter keyword would never be reported.
+# Matches against lowercased text. The leading first-character lookahead
+# skips positions where no keyword can start.
+_SEVERITY_WORDS = [keyword for keywords in SEVERITY_KEYWORDS.values() for keyword in keywords]
+SEVERITY_RE = re.compile(f'(?={_first_char_class(_SEVERITY_WORDS)})' + r'(?=\b(?:' + '|'.join(
+    f'(?P<{level}>{_build_trie_regex(keywords)})'
+    for level, keywords in SEVERITY_KEYWORDS.items()
+) + '))')
+
+# One IPv4 octet, 0-255 (up to three digits, leading zeros allowed)
+_IP_OCTET = r'(?:25[0-5]|2[0-4]\d|[01]?\d?\d)'
+
+# A service name starts at a word boundary, so inside a token like
+# 'a-b-c-...' every letter after a '-' is a candidate start. Only the first
+# candidate in a token can match (any later match is reachable from it), so
+# the pattern is anchored at the token start and skips the non-candidate
+# prefix ('9-' in '9-payment-service') in one pass. Without this, a long
+# 'a-a-a-...' token is rescanned from every '-' (quadratic time on hostile
+# input). The lookahead before the suffix skips backtracking positions
+# where no suffix can start
+_SERVICE_SUFFIXES = ['service', 'api', 'worker', 'job', 'daemon']
+_SERVICE_PREFIX = r'(?:(?:[0-9_]|(?<=\w)[a-z])[a-z0-9_]*)?(?:-+[0-9_][a-z0-9_]*)*-+'
+
+# A domain starts at a word boundary, i.e. after '.' or '-' inside a token
+# like 'a.b-c.d'. A start can reach every later start in the same token
+# unless a '..' (an empty label) lies between them, so only the first start
+# of each '..'-free stretch can match. The pattern is anchored at the
+# start of a token or just after '..', skips the non-candidate prefix
+# ('x_api.' in 'x_api.example.com', '--' in '--api.example.com'), then
+# tries the domain once. Without this, a long 'a-a-a-...' or 'a.a.a...'
+# token is rescanned from every '-'/'.' inside it (quadratic time on
+# hostile input)
+_DOMAIN_PREFIX = r'(?:(?<![a-z0-9.-])|(?<=\.\.))(?:(?<=\w)[a-z0-9]+)?(?:-|\.(?!\.))*(?<!\w)'
+
 # Entity patterns - systems, services, IPs, domains
+# Case-insensitive so extractors can scan the original text without
+# lowercasing it first; matches are normalized to lowercase afterwards.
+# The ip pattern's leading (?=\d) skips non-digit positions cheaply
 ENTITY_PATTERNS = {
-    'service': r'\b([a-z][a-z0-9_-]*(?:service|api|worker|job|daemon))\b',
-    'ip': r'\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b',
-    'domain': r'\b([a-z0-9-]+(?:\.[a-z0-9-]+)*\.[a-z]{2,})\b',
+    'service': re.compile(
+        rf'(?<![a-z0-9_-])(?:\b|{_SERVICE_PREFIX})'
+        rf'([a-z][a-z0-9_-]*(?={_first_char_class(_SERVICE_SUFFIXES)})(?:{"|".join(_SERVICE_SUFFIXES)}))\b',
+        re.IGNORECASE,
+    ),
+    'ip': re.compile(rf'(?=\d)\b({_IP_OCTET}(?:\.{_IP_OCTET}){{3}})\b'),  # Octets validated in-regex
+    'domain': re.compile(
+        rf'{_DOMAIN_PREFIX}([a-z0-9][a-z0-9-]*(?:\.[a-z0-9-]+)*\.[a-z]{{2,}})\b',
+        re.IGNORECASE,
+    ),
 }
\ No newline at end of file
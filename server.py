@@ -5,11 +5,19 @@ Exposes extraction tools to Claude via Model Context Protocol.
 """
 
 import asyncio
+import hashlib
 import json
+from collections import OrderedDict
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+# orjson is optional: ~10x faster for large results, same output layout
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import our extractors
 from extractors import (
     extract_timeline,
@@ -22,89 +30,143 @@ from extractors import (
 # Create the server instance
 app = Server("incident-timeline-extractor")
 
+# Recently computed tool results (JSON strings), most recent last.
+# Claude often re-runs tools on the same incident text within a session.
+RESULT_CACHE_SIZE = 128
+_result_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+# Fixed error payload, serialized once
+NO_TEXT_ERROR = json.dumps({"error": "No text provided"})
+
+
+def _cache_key(name: str, text: str) -> tuple:
+    """
+    Key a tool result by tool name and a digest of the input text,
+    so the cache doesn't keep large incident logs alive.
+    
+    surrogatepass: JSON allows lone surrogates ("\\ud800"), which strict
+    UTF-8 encoding rejects.
+    """
+    digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16)
+    return (name, digest.digest())
+
+
+def _reply(payload: str) -> list[TextContent]:
+    """Wrap a JSON string in the single TextContent a tool call returns."""
+    return [TextContent(type="text", text=payload)]
+
+
+def _dumps(result) -> str:
+    """
+    Serialize a tool result as indented JSON.
+    
+    orjson rejects strings that aren't valid UTF-8 (a lone surrogate from
+    the input text ending up in a context line); those fall back to json,
+    whose ASCII escaping keeps the reply encodable.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(result, indent=2)
+
+# Tool definitions, built once at import. Each tool corresponds to one of
+# our extractor functions; clients may list tools on every conversation.
+TOOLS = [
+    Tool(
+        name="extract_timeline",
+        description="Extract chronological timeline of events from incident text. "
+                   "Returns events with timestamps, actors, and full context.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Raw incident text (chat logs, notes, etc.)"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="identify_actions",
+        description="Identify actions taken during incident response. "
+                   "Categorizes actions by type (investigation, remediation, communication, status).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Raw incident text"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="extract_entities",
+        description="Extract entities involved in the incident. "
+                   "Finds services, IP addresses, and domains mentioned in text.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Raw incident text"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="detect_severity",
+        description="Detect incident severity based on keywords and context. "
+                   "Returns severity level (critical/high/medium/low/unknown) with confidence score.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Raw incident text"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="generate_summary",
+        description="Generate comprehensive incident summary. "
+                   "Combines timeline, actions, entities, and severity into structured report.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Raw incident text"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+]
+
+# Tool name -> extractor function
+DISPATCH = {
+    "extract_timeline": extract_timeline,
+    "identify_actions": identify_actions,
+    "extract_entities": extract_entities,
+    "detect_severity": detect_severity,
+    "generate_summary": generate_summary,
+}
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """
     List available tools for Claude to use.
     Each tool corresponds to one of our extractor functions.
     """
-    return [
-        Tool(
-            name="extract_timeline",
-            description="Extract chronological timeline of events from incident text. "
-                       "Returns events with timestamps, actors, and full context.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Raw incident text (chat logs, notes, etc.)"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="identify_actions",
-            description="Identify actions taken during incident response. "
-                       "Categorizes actions by type (investigation, remediation, communication, status).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Raw incident text"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="extract_entities",
-            description="Extract entities involved in the incident. "
-                       "Finds services, IP addresses, and domains mentioned in text.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Raw incident text"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="detect_severity",
-            description="Detect incident severity based on keywords and context. "
-                       "Returns severity level (critical/high/medium/low/unknown) with confidence score.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Raw incident text"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="generate_summary",
-            description="Generate comprehensive incident summary. "
-                       "Combines timeline, actions, entities, and severity into structured report.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Raw incident text"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-    ]
+    return TOOLS
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
@@ -116,41 +178,38 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     text = arguments.get("text", "")
     
     if not text:
-        return [TextContent(
-            type="text",
-            text=json.dumps({"error": "No text provided"})
-        )]
+        return _reply(NO_TEXT_ERROR)
+    
+    # Serve repeat requests from the cache
+    key = _cache_key(name, text)
+    cached = _result_cache.get(key)
+    if cached is not None:
+        _result_cache.move_to_end(key)
+        return _reply(cached)
     
     # Route to appropriate extractor
+    extractor = DISPATCH.get(name)
+    if extractor is None:
+        return _reply(json.dumps({"error": f"Unknown tool: {name}"}))
+    
     try:
-        if name == "extract_timeline":
-            result = extract_timeline(text)
-        elif name == "identify_actions":
-            result = identify_actions(text)
-        elif name == "extract_entities":
-            result = extract_entities(text)
-        elif name == "detect_severity":
-            result = detect_severity(text)
-        elif name == "generate_summary":
-            result = generate_summary(text)
-        else:
-            return [TextContent(
-                type="text",
-                text=json.dumps({"error": f"Unknown tool: {name}"})
-            )]
+        # Extractors are CPU-bound; run them in a worker thread so the
+        # event loop keeps serving the MCP session meanwhile
+        result = await asyncio.to_thread(extractor, text)
+        
+        # Cache the serialized result (immutable, safe to share),
+        # evicting the least recently used entry when full
+        result_json = _dumps(result)
+        _result_cache[key] = result_json
+        if len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
         
         # Return result as JSON
-        return [TextContent(
-            type="text",
-            text=json.dumps(result, indent=2)
-        )]
+        return _reply(result_json)
     
     except Exception as e:
         # Handle any errors gracefully
-        return [TextContent(
-            type="text",
-            text=json.dumps({"error": str(e)})
-        )]
+        return _reply(json.dumps({"error": str(e)}))
     
 async def main():
     """Run the MCP server."""
@@ -4,7 +4,7 @@ Tests for extraction logic in extractors.py
 
 import pytest
 from textwrap import dedent
-from extractors import extract_timeline, _find_timestamp, _find_actor, identify_actions, extract_entities, _is_valid_ip, _is_likely_domain, detect_severity, generate_summary
+from extractors import extract_timeline, _split_lines, _parse_timestamp, _find_timestamp, _find_actor, identify_actions, extract_entities, _is_valid_ip, _is_likely_domain, detect_severity, generate_summary
 
 
 class TestExtractTimeline:
@@ -182,6 +182,172 @@ class TestExtractTimeline:
         assert 'actor' not in events[0]
         assert 'actor' not in events[1]
 
+    def test_false_positive_context_stays_on_its_line(self):
+        """'ratio' at the end of one line shouldn't filter the next line's time"""
+        text = "checking the error ratio\n14:30 rollback started"
+
+        events = extract_timeline(text)
+
+        assert events == [{'time': '14:30', 'text': '14:30 rollback started'}]
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Date: 2024-01-15\n14:30 alert fired by @sarah",
+         [{'time': '14:30', 'text': '14:30 alert fired by @sarah', 'actor': 'sarah'}]),
+        ("Deployed 2024-01-15\n\n09:00 rollback",
+         [{'time': '09:00', 'text': '09:00 rollback'}]),
+    ])
+    def test_date_does_not_join_time_on_next_line(self, text, expected):
+        """A date ending one line and a time starting the next are separate"""
+        assert extract_timeline(text) == expected
+
+    def test_filters_by_match_position(self):
+        """A filtered candidate shouldn't hide a real time later on the line"""
+        text = "ratio x14:30 build flagged, paged on-call at 14:30"
+
+        events = extract_timeline(text)
+
+        assert [event['time'] for event in events] == ['14:30']
+
+    def test_repeated_actor_shares_one_string(self):
+        """Events from the same actor should reuse one string"""
+        text = "@sarah 14:23: paged\n@mike 14:24: on it\n@sarah 14:25: ack"
+
+        events = extract_timeline(text)
+
+        assert events[0]['actor'] is events[2]['actor']
+
+    def test_actors_are_not_interned(self):
+        """Actors come from untrusted text and shouldn't enter the intern table"""
+        import sys
+        events = extract_timeline("@zq-unseen-actor 14:23: paged")
+
+        assert events[0]['actor'] is not sys.intern('zq-unseen-actor')
+
+    def test_one_event_per_line(self):
+        """A line with several times yields one event for its first time"""
+        text = "@sarah 14:23: paged at 14:20, acked 14:22\n@mike 14:25: on it"
+
+        events = extract_timeline(text)
+
+        assert [e['time'] for e in events] == ['14:23', '14:25']
+
+
+class TestTimelineSorting:
+    """Tests for chronological ordering of extract_timeline output"""
+    
+    def test_sorts_out_of_order_events(self):
+        """Should order events by time, not by line position"""
+        text = dedent("""
+            @mike 14:30: Rollback complete
+            @sarah 14:23: Seeing elevated errors
+            @alice 9:05: Earlier deploy went out
+        """).strip()
+        
+        events = extract_timeline(text)
+        
+        assert [e['time'] for e in events] == ['9:05', '14:23', '14:30']
+    
+    def test_keeps_order_across_midnight(self):
+        """A large backwards jump should be treated as the next day"""
+        text = dedent("""
+            @sarah 23:50: Alert fired
+            @mike 23:58: Investigating
+            @sarah 00:05: Rolled back
+        """).strip()
+        
+        events = extract_timeline(text)
+        
+        assert [e['time'] for e in events] == ['23:50', '23:58', '00:05']
+    
+    def test_dated_event_after_rollover_keeps_its_date(self):
+        """A dated event should sort on its own date, not the rolled-over day"""
+        text = dedent("""
+            2024-01-15 23:55 alert fired
+            00:05 rolled back
+            2024-01-15 23:58 paged on-call
+        """).strip()
+        
+        events = extract_timeline(text)
+        
+        assert [e['time'] for e in events] == ['2024-01-15 23:55', '2024-01-15 23:58', '00:05']
+    
+    def test_rollover_sorts_against_next_dated_day(self):
+        """A time-only event past midnight should interleave with the next date"""
+        text = dedent("""
+            2024-01-15 23:50 alert fired
+            00:10 rolled back
+            2024-01-16 00:05 paged on-call
+        """).strip()
+        
+        events = extract_timeline(text)
+        
+        assert [e['time'] for e in events] == ['2024-01-15 23:50', '2024-01-16 00:05', '00:10']
+    
+    def test_invalid_date_is_treated_as_time_only(self):
+        """Dates that aren't on the calendar shouldn't break sorting"""
+        text = dedent("""
+            14:00 alert fired
+            2024-13-45 14:30 rolled back
+            14:10 paged on-call
+        """).strip()
+        
+        events = extract_timeline(text)
+        
+        assert [e['time'] for e in events] == ['14:00', '14:10', '2024-13-45 14:30']
+    
+    def test_sorts_dated_events_by_date(self):
+        """Dated events should sort by date before time"""
+        text = dedent("""
+            2024-10-16T01:00:00Z sarah.chen: Follow-up
+            2024-10-15T23:00:00Z james.rodriguez: Incident opened
+        """).strip()
+        
+        events = extract_timeline(text)
+        
+        assert events[0]['time'] == '2024-10-15T23:00:00Z'
+        assert events[1]['time'] == '2024-10-16T01:00:00Z'
+    
+    def test_equal_times_keep_original_order(self):
+        """Sorting should be stable for events at the same time"""
+        text = dedent("""
+            @sarah 14:23: first
+            @mike 14:23: second
+        """).strip()
+        
+        events = extract_timeline(text)
+        
+        assert [e['actor'] for e in events] == ['sarah', 'mike']
+
+
+class TestParseTimestamp:
+    """Tests for _parse_timestamp helper"""
+    
+    @pytest.mark.parametrize("timestamp,expected", [
+        ("14:23", (None, 14 * 3600 + 23 * 60)),
+        ("9:05", (None, 9 * 3600 + 5 * 60)),
+        ("14:23:45", (None, 14 * 3600 + 23 * 60 + 45)),
+        ("2024-01-15 14:30", ("2024-01-15", 14 * 3600 + 30 * 60)),
+        ("2024-10-15T14:23:15Z", ("2024-10-15", 14 * 3600 + 23 * 60 + 15)),
+    ])
+    def test_parses_all_formats(self, timestamp, expected):
+        """Should split every supported format into (date, seconds)"""
+        assert _parse_timestamp(timestamp) == expected
+
+
+class TestSplitLines:
+    """Tests for _split_lines helper"""
+    
+    def test_strips_and_drops_blank_lines(self):
+        """Should strip each line and skip empty ones"""
+        text = "  @sarah 14:23: first  \n\n   \n@mike 14:25: second\n"
+        
+        assert _split_lines(text) == ['@sarah 14:23: first', '@mike 14:25: second']
+    
+    def test_empty_input(self):
+        """Should return an empty list for blank input"""
+        assert _split_lines("") == []
+        assert _split_lines("  \n\n  ") == []
+
 
 class TestFindTimestamp:
     """Tests for _find_timestamp helper"""
@@ -205,6 +371,12 @@ class TestFindTimestamp:
         """Should filter out 'ratio of 3:45' patterns"""
         result = _find_timestamp("error ratio of 3:45")
         assert result is None
+    
+    def test_filters_by_match_position(self):
+        """Should check the context of the actual match, not an earlier copy"""
+        # 'x14:30' is not a timestamp, but the real one is far from 'ratio'
+        result = _find_timestamp("ratio x14:30 build flagged, paged on-call at 14:30")
+        assert result == "14:30"
 
 
 class TestFindActor:
@@ -242,6 +414,15 @@ class TestFindActor:
         assert _find_actor("sarah.chen: investigating") == "sarah.chen"
         assert _find_actor("james.rodriguez: taking role") == "james.rodriguez"
 
+    def test_speaker_prefix_wins_over_later_mention(self):
+        """Should attribute the line to the speaker, not a mentioned user"""
+        assert _find_actor("sarah.chen: @channel seeing errors") == "sarah.chen"
+        assert _find_actor("Mike: @alice please roll back") == "Mike"
+    
+    def test_skips_filtered_label_to_later_actor(self):
+        """Should keep looking after a filtered label"""
+        assert _find_actor("Status: @sarah resolved it") == "sarah"
+
 class TestIdentifyActions:
     """Tests for identify_actions function"""
     
@@ -341,6 +522,58 @@ class TestIdentifyActions:
         assert len(actions) == 1
         assert actions[0]['action'] in ['investigated', 'deployed']
     
+    def test_matches_whole_words_only(self):
+        """Keywords embedded in longer words should not count as actions"""
+        text = dedent("""
+            ticket still unresolved
+            @sarah redeployed the canary
+            @mike resolved, deployed.
+        """).strip()
+        
+        actions = identify_actions(text)
+        
+        assert len(actions) == 1
+        assert actions[0]['action'] == 'resolved'
+    
+    def test_first_mentioned_action_wins(self):
+        """Should record the action that appears first in the line"""
+        text = "@sarah deployed the fix after investigating"
+        
+        actions = identify_actions(text)
+        
+        assert len(actions) == 1
+        assert actions[0]['action'] == 'deployed'
+        assert actions[0]['category'] == 'remediation'
+    
+    def test_repeated_action_keeps_stripped_line_context(self):
+        """A repeated action in one line yields one entry with the stripped line"""
+        text = "  @sarah restarted api, then restarted db  \n@mike checked logs"
+        
+        actions = identify_actions(text)
+        
+        assert [a['action'] for a in actions] == ['restarted', 'checked']
+        assert actions[0]['context'] == '@sarah restarted api, then restarted db'
+    
+    def test_repeated_keywords_share_one_string(self):
+        """Repeated action keywords and categories should reuse one string"""
+        text = "@sarah deployed fix\n@mike deployed canary"
+        
+        actions = identify_actions(text)
+        
+        assert actions[0]['action'] is actions[1]['action']
+        assert actions[0]['category'] is actions[1]['category']
+    
+    def test_context_when_lowercasing_changes_length(self):
+        """Context stays correct when lowercase text is longer ('İ' -> 'i̇')"""
+        text = "İstanbul team escalated\n@mike deployed fix"
+        
+        actions = identify_actions(text)
+        
+        assert [a['context'] for a in actions] == [
+            "İstanbul team escalated",
+            "@mike deployed fix",
+        ]
+    
     def test_empty_input(self):
         """Should handle empty input"""
         assert identify_actions("") == []
@@ -500,6 +733,14 @@ class TestExtractEntities:
         # Should only appear once
         assert entities['services'].count('payment-service') == 1
     
+    def test_preserves_first_seen_order(self):
+        """Deduplicated entities should keep the order they first appear in"""
+        text = "auth-api then payment-service, auth-api again, then user-service"
+        
+        entities = extract_entities(text)
+        
+        assert entities['services'] == ['auth-api', 'payment-service', 'user-service']
+    
     def test_filters_invalid_ips(self):
         """Should filter out invalid IP addresses"""
         text = dedent("""
@@ -551,6 +792,7 @@ class TestIsValidIp:
         "172.16.0.1",
         "0.0.0.0",
         "255.255.255.255",
+        "010.000.000.001",
     ])
     def test_accepts_valid_ips(self, ip):
         """Should accept valid IP addresses"""
@@ -711,6 +953,29 @@ class TestDetectSeverity:
         # Should find multi-word indicators
         assert 'high error rate' in result['indicators'] or 'complete loss' in result['indicators']
     
+    def test_ignores_keywords_inside_words(self):
+        """Keywords should not fire from the middle of another word"""
+        text = "checking this downstream dependency in the analysis"
+        
+        result = detect_severity(text)
+        
+        assert result['level'] == 'unknown'
+        assert result['indicators'] == []
+    
+    def test_matches_inflected_keywords(self):
+        """Keywords with a suffix should still count"""
+        result = detect_severity("timeouts seen rarely")
+        
+        assert 'timeout' in result['indicators']
+        assert 'rare' in result['indicators']
+    
+    def test_finds_keyword_after_mid_word_occurrence(self):
+        """A mid-word occurrence shouldn't hide a later real one"""
+        result = detect_severity("noncritical alarm cleared, then critical alert")
+        
+        assert result['level'] == 'critical'
+        assert result['indicators'] == ['critical']
+    
     def test_empty_input(self):
         """Should handle empty input"""
         result = detect_severity("")
@@ -813,6 +1078,21 @@ class TestGenerateSummary:
         assert 'ips' in summary_text.lower()
         assert 'domains' in summary_text.lower()
     
+    def test_shared_preprocessing_matches_individual_extractors(self):
+        """Summary should agree with running each extractor on its own"""
+        text = dedent("""
+            @Sarah 14:23: Payment-Service IS DOWN, Critical Outage
+            
+               @MIKE 14:25: DEPLOYED fix, İnvestigating side effects   
+            @alice 14:30: Resolved
+        """).strip()
+        
+        summary = generate_summary(text)
+        
+        assert summary['timeline'] == extract_timeline(text)
+        assert summary['actions'] == identify_actions(text)
+        assert summary['severity'] == detect_severity(text)
+    
     def test_handles_minimal_incident(self):
         """Should handle incident with minimal information"""
         text = "@sarah 14:23: Something happened"
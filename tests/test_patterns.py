@@ -146,6 +146,34 @@ class TestISO8601Pattern:
         assert match is not None
         assert match.group() == expected_time
 
+class TestTimestampAlternation:
+    """Tests for TIMESTAMP_RE - all timestamp formats fused into one regex"""
+
+    @pytest.mark.parametrize("text,expected_match,expected_format", [
+        ("2024-10-15T14:23:15Z sarah.chen: message", "2024-10-15T14:23:15Z", "iso8601"),
+        ("Incident started 2024-01-15 14:23 UTC", "2024-01-15 14:23", "full_datetime"),
+        ("Deploy started at 14:23:45", "14:23:45", "time_with_seconds"),
+        ("Error occurred at 14:23 in the logs", "14:23", "simple_time"),
+    ])
+    def test_reports_which_format_matched(self, text, expected_match, expected_format):
+        """Should match each format and name it via lastgroup"""
+        from patterns import TIMESTAMP_RE
+        match = TIMESTAMP_RE.search(text)
+        assert match is not None
+        assert match.group() == expected_match
+        assert match.lastgroup == expected_format
+
+    @pytest.mark.parametrize("text", [
+        "connected to localhost:3000",
+        "ref:12:34:56:78",
+        "2024-01-15",
+    ])
+    def test_no_match_non_timestamps(self, text):
+        """Should reject the same non-timestamps as the individual patterns"""
+        from patterns import TIMESTAMP_RE
+        assert TIMESTAMP_RE.search(text) is None
+
+
 class TestActorPatterns:
     """Tests for ACTOR_PATTERNS - @mentions and names"""
     
@@ -228,6 +256,25 @@ class TestActorPatterns:
         assert re.search(actor_pattern, "api.example.com returned") is None
         assert re.search(actor_pattern, "timeout from service.uber.com") is None
 
+    @pytest.mark.parametrize("text,pattern_name", [
+        ("ping @status.io for updates", "mention"),
+        ("cc @Support.Company.COM", "mention"),
+        ("google.com: returned 500", "name_with_dot"),
+        ("service.io: connection refused", "name_with_dot"),
+    ])
+    def test_rejects_domain_shaped_actors(self, text, pattern_name):
+        """Candidates ending in a common TLD should not match as actors"""
+        from patterns import ACTOR_PATTERNS
+        pattern = ACTOR_PATTERNS[pattern_name]
+        assert re.search(pattern, text) is None
+
+    def test_mention_tld_check_uses_whole_handle(self):
+        """Only handles that end in a TLD are rejected"""
+        from patterns import ACTOR_PATTERNS
+        pattern = ACTOR_PATTERNS['mention']
+        assert re.search(pattern, "@mike.cohen rolled back").group(1) == "mike.cohen"
+        assert re.search(pattern, "@ops.io-team paged").group(1) == "ops.io-team"
+
     @pytest.mark.xfail(reason="Names with lowercase particles not supported (de, von, van, etc.)")
     @pytest.mark.parametrize("text,expected_name", [
         ("Ian de Marcellus: restarted service", "Ian de Marcellus"),
@@ -242,18 +289,59 @@ class TestActorPatterns:
         if match:
             assert match.group(1) == expected_name
     
-    @pytest.mark.xfail(reason="Common labels look like names, filtered in extractor")
     @pytest.mark.parametrize("text", [
         "Time: 14:23",
         "Error: connection failed",
         "Status: resolved",
         "Note: this is important",
     ])
-    def test_name_colon_ambiguous_labels(self, text):
-        """Common labels are indistinguishable from names at regex level"""
+    def test_name_colon_rejects_common_labels(self, text):
+        """Common labels look like names but are rejected by the pattern"""
         from patterns import ACTOR_PATTERNS
         pattern = ACTOR_PATTERNS['name_colon']
         assert re.search(pattern, text) is None
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("@info please ack", None),
+        ("@Status check", None),
+        ("@infosec please ack", "infosec"),
+        ("Status Update: all clear", "Status Update"),
+    ])
+    def test_labels_rejected_only_as_whole_names(self, text, expected):
+        """Label rejection shouldn't catch longer names that start with one"""
+        from patterns import ACTOR_RE
+        match = ACTOR_RE.search(text)
+        assert (match.group(match.lastindex) if match else None) == expected
+
+class TestActorRegex:
+    """Tests for ACTOR_RE - all actor formats fused into one regex"""
+
+    @pytest.mark.parametrize("text,expected_actor", [
+        ("@mike.jones rolled back deploy", "mike.jones"),
+        ("sarah.chen: investigating issue", "sarah.chen"),
+        ("Mike Jones: rolled back the deploy", "Mike Jones"),
+    ])
+    def test_lastindex_is_actor(self, text, expected_actor):
+        """The last matched group should be the actor for every format"""
+        from patterns import ACTOR_RE
+        match = ACTOR_RE.search(text)
+        assert match is not None
+        assert match.group(match.lastindex) == expected_actor
+
+    @pytest.mark.parametrize("text", [
+        "14:23 @sarah: paging",
+        "2024-10-15T14:23:15Z sarah.chen: on it",
+        "... -- Mike: rolling back",
+        "nobody here 12345",
+    ])
+    def test_matches_leftmost_individual_pattern(self, text):
+        """The first-character guard shouldn't change which actor is found"""
+        from patterns import ACTOR_PATTERNS, ACTOR_RE
+        matches = [m for m in (p.search(text) for p in ACTOR_PATTERNS.values()) if m]
+        expected = min(matches, key=lambda m: m.start()).group(1) if matches else None
+        match = ACTOR_RE.search(text)
+        assert (match.group(match.lastindex) if match else None) == expected
+
 
 class TestActionKeywords:
     """Tests for ACTION_KEYWORDS dict"""
@@ -294,6 +382,59 @@ class TestActionKeywords:
                 assert keyword == keyword.lower(), f"'{keyword}' in {category} is not lowercase"
 
 
+class TestBuildTrieRegex:
+    """Tests for _build_trie_regex helper"""
+
+    def test_merges_common_prefixes(self):
+        """Should factor shared prefixes into a single branch"""
+        from patterns import _build_trie_regex
+        assert _build_trie_regex(['checking', 'checked']) == 'check(?:ed|ing)'
+
+    def test_escapes_special_characters(self):
+        """Should escape regex metacharacters in keywords"""
+        from patterns import _build_trie_regex
+        pattern = re.compile(_build_trie_regex(['a.b', 'a+c']))
+        assert pattern.fullmatch('a.b')
+        assert pattern.fullmatch('axb') is None
+
+    def test_prefers_longest_word(self):
+        """When one word is a prefix of another, the longer should match"""
+        from patterns import _build_trie_regex
+        pattern = re.compile(_build_trie_regex(['down', 'downtime']))
+        assert pattern.search('extended downtime').group() == 'downtime'
+        assert pattern.search('is down').group() == 'down'
+
+
+class TestFirstCharClass:
+    """Tests for _first_char_class helper"""
+
+    def test_collects_distinct_first_characters(self):
+        """Should list each word's first character once, sorted"""
+        from patterns import _first_char_class
+        assert _first_char_class(['slow', 'spike', 'rare']) == '[rs]'
+
+    @pytest.mark.parametrize("words_name", ["_SEVERITY_WORDS", "_ACTION_WORDS"])
+    def test_covers_every_keyword(self, words_name):
+        """Every keyword must start with a character in its regex's guard"""
+        import patterns
+        words = getattr(patterns, words_name)
+        guard = re.compile(patterns._first_char_class(words))
+        assert all(guard.match(keyword) for keyword in words)
+
+
+class TestActionRegex:
+    """Tests for ACTION_RE - all action keywords in one regex"""
+
+    def test_matches_every_keyword_with_category(self):
+        """Every keyword should match itself and report its category"""
+        from patterns import ACTION_KEYWORDS, ACTION_RE
+        for category, keywords in ACTION_KEYWORDS.items():
+            for keyword in keywords:
+                match = ACTION_RE.fullmatch(keyword)
+                assert match is not None, f"'{keyword}' not matched"
+                assert match.lastgroup == category
+
+
 class TestSeverityKeywords:
     """Tests for SEVERITY_KEYWORDS dict"""
     
@@ -322,6 +463,34 @@ class TestSeverityKeywords:
                     f"'{keyword}' in {level} is not lowercase"
 
 
+class TestSeverityRegex:
+    """Tests for SEVERITY_RE - all severity keywords in one regex"""
+
+    def test_matches_every_keyword_with_level(self):
+        """Every keyword should be found and reported under its level"""
+        from patterns import SEVERITY_KEYWORDS, SEVERITY_RE
+        for level, keywords in SEVERITY_KEYWORDS.items():
+            for keyword in keywords:
+                match = SEVERITY_RE.match(keyword)
+                assert match is not None, f"'{keyword}' not matched"
+                assert match.lastgroup == level
+                assert match.group(level) == keyword
+
+    def test_finds_overlapping_keywords(self):
+        """Overlapping keywords should all be found"""
+        from patterns import SEVERITY_RE
+        found = [m.group(m.lastgroup) for m in SEVERITY_RE.finditer("high error rate")]
+        assert found == ['high error', 'error rate']
+
+    def test_no_keyword_is_prefix_of_another(self):
+        """_has_keyword would miss a keyword that prefixes another one"""
+        from patterns import _SEVERITY_WORDS
+        for keyword in _SEVERITY_WORDS:
+            for other in _SEVERITY_WORDS:
+                assert other == keyword or not other.startswith(keyword), \
+                    f"'{keyword}' is a prefix of '{other}'"
+
+
 class TestEntityPatterns:
     """Tests for ENTITY_PATTERNS - services, IPs, domains"""
     
@@ -365,16 +534,109 @@ class TestEntityPatterns:
         assert match is not None
         assert match.group(1) == expected_domain
     
-    @pytest.mark.xfail(reason="IP validation (0-255 per octet) done in extractor, not regex")
     @pytest.mark.parametrize("text", [
         "999.999.999.999",
         "256.256.256.256",
+        "10.0.0.256",
     ])
-    def test_invalid_ips_need_filtering(self, text):
-        """Invalid IPs match regex but will be filtered in extractor"""
+    def test_rejects_out_of_range_octets(self, text):
+        """IPs with octets above 255 should not match at all"""
         from patterns import ENTITY_PATTERNS
         pattern = ENTITY_PATTERNS['ip']
         assert re.search(pattern, text) is None
 
+    @pytest.mark.parametrize("text", [
+        "a-" * 20000,
+        "a." * 20000 + "1",
+        "1." * 20000,
+        "a--" * 20000,
+        "a.." * 20000,
+        "." * 40000 + "a",
+    ])
+    def test_domain_linear_on_long_tokens(self, text):
+        """Long hyphen/dot runs should not trigger quadratic rescanning"""
+        import time
+        from patterns import ENTITY_PATTERNS
+        start = time.perf_counter()
+        list(ENTITY_PATTERNS['domain'].finditer(text))
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.parametrize("text,expected_domain", [
+        ("see https://api.example.com/health", "api.example.com"),
+        ("host=-api.example.com", "api.example.com"),
+        ("payment-service.internal.io down", "payment-service.internal.io"),
+        ("see logs...api.example.com", "api.example.com"),
+        ("flag --api.example.com", "api.example.com"),
+        ("x ..status.io y", "status.io"),
+        (".-A.com", "A.com"),
+        ("x_api.example.com", "example.com"),
+    ])
+    def test_domain_starts_at_token_boundary(self, text, expected_domain):
+        """Domains should be matched from the start of the host token"""
+        from patterns import ENTITY_PATTERNS
+        match = re.search(ENTITY_PATTERNS['domain'], text)
+        assert match is not None
+        assert match.group(1) == expected_domain
+
+    @pytest.mark.parametrize("text", [
+        "a-" * 20000 + "!",
+        "a1-" * 20000,
+        "a--" * 20000,
+        "1-" * 20000 + "a",
+    ])
+    def test_service_linear_on_long_tokens(self, text):
+        """Long hyphenated tokens should not be rescanned from every '-'"""
+        import time
+        from patterns import ENTITY_PATTERNS
+        start = time.perf_counter()
+        list(ENTITY_PATTERNS['service'].finditer(text))
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.parametrize("text,expected_service", [
+        ("9-payment-service down", "payment-service"),
+        ("1_-auth-api failed", "auth-api"),
+        ("café-billing-worker stuck", "billing-worker"),
+        ("payment-service-billing-api", "payment-service-billing-api"),
+        ("payment-service-v2 down", "payment-service"),
+    ])
+    def test_service_starts_at_first_word_boundary(self, text, expected_service):
+        """Service names should start at the first word boundary that matches"""
+        from patterns import ENTITY_PATTERNS
+        match = re.search(ENTITY_PATTERNS['service'], text)
+        assert match is not None
+        assert match.group(1) == expected_service
+
+    def test_matches_mixed_case_without_lowercasing(self):
+        """Service and domain patterns should be case-insensitive"""
+        from patterns import ENTITY_PATTERNS
+        service = re.search(ENTITY_PATTERNS['service'], "Payment-Service is down")
+        domain = re.search(ENTITY_PATTERNS['domain'], "timeout from API.Example.com")
+        assert service.group(1) == "Payment-Service"
+        assert domain.group(1) == "API.Example.com"
+
+
+class TestPatternsCompiled:
+    """Tests that all regex patterns are compiled at import time"""
+
+    def test_all_exports_exist(self):
+        """Every name in __all__ should be defined"""
+        import patterns
+        for name in patterns.__all__:
+            assert hasattr(patterns, name), f"{name} missing"
+
+    def test_fused_patterns_are_compiled(self):
+        """Fused regexes should be compiled re.Pattern objects"""
+        import patterns
+        for name in patterns.__all__:
+            if name.endswith('_RE'):
+                assert isinstance(getattr(patterns, name), re.Pattern)
+
+    def test_all_patterns_are_compiled(self):
+        """Every regex pattern should be a compiled re.Pattern"""
+        from patterns import ACTOR_PATTERNS, ENTITY_PATTERNS
+        for patterns in (TIMESTAMP_PATTERNS, ACTOR_PATTERNS, ENTITY_PATTERNS):
+            for name, pattern in patterns.items():
+                assert isinstance(pattern, re.Pattern), f"{name} is not compiled"
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
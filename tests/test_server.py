@@ -2,6 +2,8 @@
 Smoke tests for MCP server in server.py
 """
 
+import asyncio
+import json
 import pytest
 
 class TestServerImports:
@@ -36,4 +38,161 @@ class TestExtractorsStillWork:
         
         # Quick smoke test - they should be callable
         result = extract_timeline("@sarah 14:23: test")
-        assert isinstance(result, list)
\ No newline at end of file
+        assert isinstance(result, list)
+
+
+class TestResultCache:
+    """Tests for caching of tool results in call_tool"""
+    
+    def test_repeat_call_returns_cached_result(self, monkeypatch):
+        """Same tool and text should be served from the cache"""
+        import server
+        server._result_cache.clear()
+        calls = []
+        
+        def counting_extractor(text):
+            calls.append(text)
+            return {'level': 'critical'}
+        
+        monkeypatch.setitem(server.DISPATCH, "generate_summary", counting_extractor)
+        args = {"text": "@sarah 14:23: payment-service is down"}
+        
+        first = asyncio.run(server.call_tool("generate_summary", args))
+        second = asyncio.run(server.call_tool("generate_summary", args))
+        
+        assert first[0].text == second[0].text
+        assert len(calls) == 1
+        assert len(server._result_cache) == 1
+    
+    def test_cache_is_keyed_by_tool_name(self):
+        """Different tools on the same text should not share results"""
+        import server
+        server._result_cache.clear()
+        args = {"text": "@sarah 14:23: payment-service is down"}
+        
+        timeline = asyncio.run(server.call_tool("extract_timeline", args))
+        severity = asyncio.run(server.call_tool("detect_severity", args))
+        
+        assert isinstance(json.loads(timeline[0].text), list)
+        assert json.loads(severity[0].text)['level'] == 'critical'
+    
+    def test_cache_evicts_least_recently_used(self):
+        """Cache should not grow past RESULT_CACHE_SIZE, dropping the LRU entry"""
+        import server
+        server._result_cache.clear()
+        
+        for i in range(server.RESULT_CACHE_SIZE):
+            asyncio.run(server.call_tool("detect_severity", {"text": f"outage {i}"}))
+        
+        # Touch the oldest entry so "outage 1" becomes least recently used
+        asyncio.run(server.call_tool("detect_severity", {"text": "outage 0"}))
+        asyncio.run(server.call_tool("detect_severity", {"text": "overflow"}))
+        
+        assert len(server._result_cache) == server.RESULT_CACHE_SIZE
+        assert server._cache_key("detect_severity", "outage 0") in server._result_cache
+        assert server._cache_key("detect_severity", "outage 1") not in server._result_cache
+    
+    def test_lone_surrogate_text_is_cached(self):
+        """Text with a lone surrogate (valid in JSON) should still get a key"""
+        import server
+        server._result_cache.clear()
+        args = {"text": "outage \ud800 on payment-service"}
+
+        result = asyncio.run(server.call_tool("detect_severity", args))
+
+        assert json.loads(result[0].text)['level'] == 'critical'
+        assert len(server._result_cache) == 1
+
+    def test_errors_are_not_cached(self):
+        """Unknown tools should not populate the cache"""
+        import server
+        server._result_cache.clear()
+        
+        asyncio.run(server.call_tool("no_such_tool", {"text": "outage"}))
+        
+        assert len(server._result_cache) == 0
+
+
+class TestToolRegistry:
+    """Tests for the prebuilt tool list and dispatch table"""
+    
+    def test_list_tools_returns_prebuilt_list(self):
+        """list_tools should return the same module-level list every time"""
+        import server
+        
+        assert asyncio.run(server.list_tools()) is server.TOOLS
+    
+    def test_every_tool_has_an_extractor(self):
+        """Each listed tool should be routed by DISPATCH"""
+        import server
+        
+        assert [tool.name for tool in server.TOOLS] == list(server.DISPATCH)
+    
+    def test_unknown_tool_returns_error(self):
+        """Names missing from DISPATCH should return an error payload"""
+        import server
+        
+        result = asyncio.run(server.call_tool("no_such_tool", {"text": "outage"}))
+        
+        assert json.loads(result[0].text) == {"error": "Unknown tool: no_such_tool"}
+    
+    def test_missing_text_returns_error(self):
+        """Calls without text should return the fixed error payload"""
+        import server
+        
+        result = asyncio.run(server.call_tool("extract_timeline", {}))
+        
+        assert json.loads(result[0].text) == {"error": "No text provided"}
+    
+    def test_extractor_runs_off_the_event_loop_thread(self, monkeypatch):
+        """call_tool should not block the event loop on extraction"""
+        import threading
+        import server
+        server._result_cache.clear()
+        threads = []
+        
+        def fake_extractor(text):
+            threads.append(threading.get_ident())
+            return []
+        
+        monkeypatch.setitem(server.DISPATCH, "extract_timeline", fake_extractor)
+        asyncio.run(server.call_tool("extract_timeline", {"text": "14:23 test"}))
+        
+        assert threads and threads[0] != threading.get_ident()
+
+
+class TestDumps:
+    """Tests for result serialization"""
+    
+    def test_matches_stdlib_indented_json(self):
+        """orjson (when installed) and json should produce the same layout"""
+        import server
+        result = {'level': 'high', 'indicators': ['outage', 'spike'], 'n': [1, 2]}
+        
+        assert server._dumps(result) == json.dumps(result, indent=2)
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("value", ["café", "\U0001F525 fire", "bad \ud800 byte"])
+    def test_round_trips_unicode(self, monkeypatch, use_orjson, value):
+        """Non-BMP and lone-surrogate text should serialize and parse back"""
+        import server
+        if not use_orjson:
+            monkeypatch.setattr(server, "orjson", None)
+        result = {'context': value}
+        
+        payload = server._dumps(result)
+        
+        assert json.loads(payload) == result
+        payload.encode('utf-8')  # Reply must be encodable for the transport
+    
+    def test_surrogate_text_returns_result(self):
+        """A lone surrogate in the input shouldn't turn into an error payload"""
+        import server
+        server._result_cache.clear()
+        args = {"text": "@sarah 14:23: outage \ud800 on payment-service"}
+        
+        result = asyncio.run(server.call_tool("extract_timeline", args))
+        
+        events = json.loads(result[0].text)
+        assert events[0]['time'] == '14:23'
+        assert events[0]['actor'] == 'sarah'